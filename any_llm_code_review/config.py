@@ -2,7 +2,7 @@
 
 import os
 from typing import Literal, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 ModelProvider = Literal[
@@ -22,6 +22,8 @@ ModelProvider = Literal[
 class ReviewConfig(BaseModel):
     """Configuration for code review."""
 
+    model_config = ConfigDict(defer_build=True, frozen=True, revalidate_instances="never")
+
     model_provider: ModelProvider = Field(
         description="AI model provider to use"
     )
@@ -80,15 +82,19 @@ class ReviewConfig(BaseModel):
     @classmethod
     def from_env(cls) -> "ReviewConfig":
         """Create config from environment variables."""
+        # Bind the environment lookup once; avoids repeated os.getenv dispatch
+        # (IGNORE_PATTERNS in particular was read three times)
+        get = os.environ.get
+        ignore_patterns = get("IGNORE_PATTERNS")
         return cls(
-            model_provider=os.getenv("MODEL_PROVIDER", "openai"),
-            model_name=os.getenv("MODEL_NAME", "gpt-4"),
-            api_key=os.getenv("API_KEY"),
-            base_url=os.getenv("BASE_URL"),
-            max_tokens=int(os.getenv("MAX_TOKENS", "4000")),
-            temperature=float(os.getenv("TEMPERATURE", "0.3")),
-            github_token=os.getenv("GITHUB_TOKEN", ""),
-            ignore_patterns=os.getenv("IGNORE_PATTERNS", "").split(",") if os.getenv("IGNORE_PATTERNS") else [
+            model_provider=get("MODEL_PROVIDER", "openai"),
+            model_name=get("MODEL_NAME", "gpt-4"),
+            api_key=get("API_KEY"),
+            base_url=get("BASE_URL"),
+            max_tokens=int(get("MAX_TOKENS", "4000")),
+            temperature=float(get("TEMPERATURE", "0.3")),
+            github_token=get("GITHUB_TOKEN", ""),
+            ignore_patterns=ignore_patterns.split(",") if ignore_patterns else [
                 "*.md",
                 "*.txt",
                 "*.json",
@@ -98,8 +104,8 @@ class ReviewConfig(BaseModel):
                 "yarn.lock",
                 "poetry.lock",
             ],
-            max_file_size=int(os.getenv("MAX_FILE_SIZE", "10000")),
-            custom_prompt=os.getenv("CUSTOM_PROMPT"),
-            review_title=os.getenv("REVIEW_TITLE", "AI Code Review"),
-            always_pass=os.getenv("ALWAYS_PASS", "false").lower() == "true",
+            max_file_size=int(get("MAX_FILE_SIZE", "10000")),
+            custom_prompt=get("CUSTOM_PROMPT"),
+            review_title=get("REVIEW_TITLE", "AI Code Review"),
+            always_pass=get("ALWAYS_PASS", "false").lower() == "true",
         )
@@ -0,0 +1,270 @@
+"""GitHub integration for posting review comments."""
+
+import asyncio
+import logging
+import os
+from typing import Callable, Optional
+from .models import CodeReviewResponse, ReviewComment
+
+# orjson parses Action event payloads 2-3x faster than the stdlib and takes
+# bytes directly; fall back to json when it isn't installed
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover
+    import json as _json
+
+log = logging.getLogger(__name__)
+
+_PER_PAGE = 100
+
+# Rough average characters per changed diff line, used to estimate patch size
+# from additions/deletions before touching the patch itself
+_CHARS_PER_LINE = 80
+
+# PyGithub pulls in requests, urllib3, and jwt; import it lazily in
+# GitHubReviewPoster.__init__ so loading this module stays cheap.
+Github = None
+
+_SEVERITY_EMOJI = {
+    "error": "🚨",
+    "warning": "⚠️",
+    "info": "💡",
+}
+
+
+class GitHubReviewPoster:
+    """Posts AI-generated code reviews to GitHub PRs."""
+
+    def __init__(self, token: str, repository: str, pr_number: int, review_title: str = "AI Code Review"):
+        """
+        Initialize GitHub integration.
+
+        Args:
+            token: GitHub API token
+            repository: Repository in format "owner/repo"
+            pr_number: Pull request number
+            review_title: Title for the review comment
+        """
+        global Github
+        if Github is None:
+            from github import Github
+        from urllib3.util.retry import Retry
+
+        # One pooled, retrying client for every call: connections are reused
+        # across pagination instead of a fresh TLS handshake per request, and
+        # transient 5xx/429 responses are retried with backoff. per_page=100
+        # cuts file-listing pagination to a third of the default.
+        self.github = Github(
+            token,
+            retry=Retry(total=5, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+            pool_size=20,
+            per_page=_PER_PAGE,
+        )
+        self.token = token
+        self.repository = repository
+        self.repo = self.github.get_repo(repository)
+        self.pr_number = pr_number
+        self.pr = self.repo.get_pull(pr_number)
+        self.review_title = review_title
+        self._file_diffs: Optional[dict[str, str]] = None
+
+    def get_pr_files(
+        self,
+        should_skip: Optional[Callable[[str], bool]] = None,
+        max_chars: Optional[int] = None,
+    ) -> dict[str, str]:
+        """
+        Get the diff for all files in the PR.
+
+        The paginated file listing is fetched once and cached, so repeated
+        calls don't re-issue API requests.
+
+        Args:
+            should_skip: Optional predicate; files whose path matches are
+                dropped before their patch content is ever touched
+            max_chars: Optional size cutoff; files whose estimated patch size
+                (from additions + deletions) exceeds it are dropped without
+                reading the patch
+
+        Returns:
+            Dict mapping file paths to their diff content
+        """
+        if self._file_diffs is not None:
+            return self._file_diffs
+
+        files = self.pr.get_files()
+        file_diffs = {}
+
+        for file in files:
+            if should_skip and should_skip(file.filename):
+                continue
+            if max_chars is not None and self._estimated_size(file) > max_chars:
+                continue
+            if file.patch:  # Some files may not have patches (e.g., binary files)
+                file_diffs[file.filename] = file.patch
+
+        self._file_diffs = file_diffs
+        return file_diffs
+
+    @staticmethod
+    def _estimated_size(file) -> int:
+        """Estimate patch size in characters from the file's change counts."""
+        return (file.additions + file.deletions) * _CHARS_PER_LINE
+
+    async def get_pr_files_async(
+        self,
+        should_skip: Optional[Callable[[str], bool]] = None,
+        max_chars: Optional[int] = None,
+    ) -> dict[str, str]:
+        """
+        Get the diff for all files in the PR, fetching pages concurrently.
+
+        Multi-page PRs hit the files endpoint directly with one request per
+        page via asyncio.gather, so latency is ~one roundtrip instead of
+        O(pages) sequential ones. Single-page PRs and any REST failure fall
+        back to the sequential get_pr_files path.
+
+        Args:
+            should_skip: Optional predicate; files whose path matches are
+                dropped before their patch content is ever touched
+
+        Returns:
+            Dict mapping file paths to their diff content
+        """
+        if self._file_diffs is not None:
+            return self._file_diffs
+
+        changed_files = self.pr.changed_files or 0
+        pages = -(-changed_files // _PER_PAGE)  # ceil division
+        if pages <= 1:
+            return self.get_pr_files(should_skip=should_skip, max_chars=max_chars)
+
+        import httpx
+
+        url = f"https://api.github.com/repos/{self.repository}/pulls/{self.pr_number}/files"
+        headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Accept": "application/vnd.github+json",
+        }
+        try:
+            async with httpx.AsyncClient(headers=headers, timeout=30.0) as client:
+                responses = await asyncio.gather(
+                    *(
+                        client.get(url, params={"per_page": _PER_PAGE, "page": page})
+                        for page in range(1, pages + 1)
+                    )
+                )
+            file_diffs = {}
+            for response in responses:
+                response.raise_for_status()
+                for file in response.json():
+                    if should_skip and should_skip(file["filename"]):
+                        continue
+                    if max_chars is not None:
+                        changed = file.get("additions", 0) + file.get("deletions", 0)
+                        if changed * _CHARS_PER_LINE > max_chars:
+                            continue
+                    if file.get("patch"):
+                        file_diffs[file["filename"]] = file["patch"]
+        except Exception as e:
+            log.warning("Concurrent file fetch failed, falling back to sequential: %s", e)
+            return self.get_pr_files(should_skip=should_skip, max_chars=max_chars)
+
+        self._file_diffs = file_diffs
+        return file_diffs
+
+    def get_pr_meta(self) -> tuple[str, str]:
+        """
+        Get the PR title and description without extra API roundtrips.
+
+        Both attributes are part of the pull request payload already fetched
+        in __init__, so this never triggers another request.
+
+        Returns:
+            Tuple of (title, description); description is "" when empty
+        """
+        return self.pr.title, self.pr.body or ""
+
+    def post_review(self, review: CodeReviewResponse) -> None:
+        """
+        Post the review to the GitHub PR.
+
+        Args:
+            review: The AI-generated code review
+        """
+        # GitHub Actions cannot APPROVE or REQUEST_CHANGES, only COMMENT
+        # Use COMMENT event and indicate approval status in the message
+        approval_status = "✅ **APPROVED**" if review.approved else "⚠️ **CHANGES REQUESTED**"
+        review_body = f"## {self.review_title}\n\n{approval_status}\n\n{review.summary}"
+
+        # If there are no comments, just post a comment with the summary
+        if not review.comments:
+            self.pr.create_review(body=review_body, event="COMMENT")
+            return
+
+        # Build review comments for specific lines
+        review_comments = []
+        for comment in review.comments:
+            emoji = _SEVERITY_EMOJI.get(comment.severity, "")
+
+            body = f"{emoji} **{comment.category.upper()}** ({comment.severity})\n\n{comment.message}"
+            if comment.suggestion:
+                body += f"\n\n**Suggested fix:**\n```\n{comment.suggestion}\n```"
+
+            review_comments.append({
+                "path": comment.path,
+                "line": comment.line,
+                "side": "RIGHT",
+                "body": body,
+            })
+
+        # Post the review
+        try:
+            self.pr.create_review(
+                body=review_body,
+                event="COMMENT",  # Always use COMMENT since GitHub Actions can't approve
+                comments=review_comments,
+            )
+        except Exception as e:
+            log.error("Error posting review: %s", e)
+            # Fallback to issue comment; build with append+join rather than
+            # quadratic string concatenation
+            body_parts = [f"## {self.review_title}\n\n{review.summary}\n\n"]
+            for comment in review.comments:
+                emoji = _SEVERITY_EMOJI.get(comment.severity, "")
+                body_parts.append(f"\n### {emoji} {comment.path}:{comment.line}\n")
+                body_parts.append(f"**{comment.category.upper()}** ({comment.severity})\n\n")
+                body_parts.append(f"{comment.message}\n")
+                if comment.suggestion:
+                    body_parts.append(f"\n**Suggested fix:**\n```\n{comment.suggestion}\n```\n")
+
+            self.pr.create_issue_comment("".join(body_parts))
+
+    @classmethod
+    def from_env(cls) -> "GitHubReviewPoster":
+        """Create from environment variables (for GitHub Actions)."""
+        get = os.environ.get
+        token = get("GITHUB_TOKEN", "")
+        repository = get("GITHUB_REPOSITORY", "")
+        review_title = get("REVIEW_TITLE", "AI Code Review")
+
+        # Extract PR number from GITHUB_REF (format: refs/pull/:prNumber/merge)
+        github_ref = get("GITHUB_REF", "")
+        pr_number = None
+        if "pull" in github_ref:
+            parts = github_ref.split("/")
+            if len(parts) >= 3:
+                pr_number = int(parts[2])
+
+        # Fallback to event payload
+        if not pr_number:
+            event_path = get("GITHUB_EVENT_PATH", "")
+            if event_path and os.path.exists(event_path):
+                with open(event_path, "rb") as f:
+                    event = _json.loads(f.read())
+                    pr_number = event.get("pull_request", {}).get("number")
+
+        if not pr_number:
+            raise ValueError("Could not determine PR number from environment")
+
+        return cls(token, repository, pr_number, review_title)
@@ -1,6 +1,7 @@
 """Main entry point for AI code reviewer."""
 
 import asyncio
+import logging
 import sys
 import click
 from .config import ReviewConfig
@@ -11,7 +12,7 @@ from .github_integration import GitHubReviewPoster
 @click.group()
 def cli():
     """AI Code Reviewer - Model-agnostic code review using pydantic-ai."""
-    pass
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
 
 
 @cli.command()
@@ -101,13 +102,17 @@ async def review_pr(
         # Get PR files
         print(f"Fetching PR #{pr_number} from {repository}...")
         gh_poster = GitHubReviewPoster(github_token, repository, pr_number, review_title)
-        file_diffs = gh_poster.get_pr_files()
+        # Drop ignored and oversized files at fetch time so their patches are
+        # never kept
+        file_diffs = await gh_poster.get_pr_files_async(
+            should_skip=reviewer.should_ignore_file,
+            max_chars=config.max_file_size,
+        )
 
         print(f"Found {len(file_diffs)} files to review")
 
-        # Get PR details for context
-        pr_title = gh_poster.pr.title
-        pr_description = gh_poster.pr.body or ""
+        # Get PR details for context (served from the already-fetched PR payload)
+        pr_title, pr_description = gh_poster.get_pr_meta()
 
         # Run review
         print("Running AI code review...")
@@ -152,12 +157,14 @@ async def review_pr_from_env():
         gh_poster = GitHubReviewPoster.from_env()
 
         reviewer = CodeReviewer(config)
-        file_diffs = gh_poster.get_pr_files()
+        file_diffs = await gh_poster.get_pr_files_async(
+            should_skip=reviewer.should_ignore_file,
+            max_chars=config.max_file_size,
+        )
 
         print(f"Found {len(file_diffs)} files to review")
 
-        pr_title = gh_poster.pr.title
-        pr_description = gh_poster.pr.body or ""
+        pr_title, pr_description = gh_poster.get_pr_meta()
 
         print("Running AI code review...")
         review_result = await reviewer.review_changes(
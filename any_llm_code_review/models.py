@@ -1,12 +1,14 @@
 """Data models for code review."""
 
 from typing import Literal, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ReviewComment(BaseModel):
     """A single code review comment."""
 
+    model_config = ConfigDict(defer_build=True, frozen=True, revalidate_instances="never")
+
     path: str = Field(description="File path where the comment applies")
     line: int = Field(description="Line number for the comment")
     severity: Literal["info", "warning", "error"] = Field(
@@ -22,6 +24,8 @@ class ReviewComment(BaseModel):
 class CodeReviewResponse(BaseModel):
     """Response from the AI code reviewer."""
 
+    model_config = ConfigDict(defer_build=True, frozen=True, revalidate_instances="never")
+
     summary: str = Field(description="Overall summary of the code changes")
     comments: list[ReviewComment] = Field(
         default_factory=list, description="List of review comments"
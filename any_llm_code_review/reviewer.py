@@ -0,0 +1,352 @@
+"""Core AI code reviewer using pydantic-ai."""
+
+import asyncio
+import fnmatch
+import io
+import os
+import re
+from typing import Iterable
+
+from .config import ReviewConfig
+from .models import CodeReviewResponse
+
+
+SYSTEM_PROMPT = """You are an expert code reviewer. Your role is to:
+
+1. Analyze code changes for:
+   - Bugs and logic errors
+   - Security vulnerabilities
+   - Performance issues
+   - Code quality and best practices
+   - Potential edge cases
+   - Maintainability concerns
+
+2. Provide constructive feedback:
+   - Be specific and actionable
+   - Suggest improvements when appropriate
+   - Explain the reasoning behind your comments
+   - Categorize issues appropriately
+
+3. Severity levels:
+   - error: Critical issues that must be fixed (bugs, security issues)
+   - warning: Important issues that should be addressed (performance, best practices)
+   - info: Suggestions and minor improvements
+
+4. Line numbers - CRITICAL:
+   Each diff line is annotated with [Line X] showing its exact line number in the new file.
+
+   Example:
+   ```diff
+   @@ -76,14 +76,15 @@
+   [Line 76]  @classmethod
+   [Line 77]  def from_env(cls) -> "ReviewConfig":
+   [Line 78]      \"\"\"Create config from environment variables.\"\"\"
+   [Line 79]      return cls(
+   [Line 80]          model_provider=os.getenv("MODEL_PROVIDER", "openai"),
+   [Line 81]          model_name=os.getenv("MODEL_NAME", "gpt-4"),
+   [Line 82]          api_key=os.getenv("API_KEY"),
+   [Line 83]          base_url=os.getenv("BASE_URL"),
+   [Line 84]          max_tokens=int(os.getenv("MAX_TOKENS", "4000")),
+   [Line 85]          temperature=float(os.getenv("TEMPERATURE", "0.3")),
+   [Line 86]          github_token=os.getenv("GITHUB_TOKEN", ""),
+   [Line 87] +        ignore_patterns=os.getenv("IGNORE_PATTERNS").split(",") if os.getenv("IGNORE_PATTERNS") else [
+   [Line 88] +            "*.md",
+   ```
+
+   TO COMMENT ON A LINE:
+   - Look for the [Line X] annotation at the start of the line
+   - Use that EXACT number in your comment's "line" field
+   - Example: To comment on the ignore_patterns issue above, use line: 87
+
+   DO NOT try to calculate line numbers yourself - just read the [Line X] annotations!
+
+Only report genuine issues. If the code looks good, approve it with an empty comments list.
+"""
+
+# Byte budget per review batch; keeps each prompt well inside context limits
+# while letting small PRs go through in a single call.
+BATCH_BYTE_BUDGET = 60_000
+
+# Hunk header format: @@ -old_start,old_count +new_start,new_count @@
+_HUNK_RE = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)')
+
+# pydantic-ai reads API keys and base URLs from these environment variables
+_API_KEY_VAR = {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "gemini": "GEMINI_API_KEY",
+    "groq": "GROQ_API_KEY",
+    "mistral": "MISTRAL_API_KEY",
+    "huggingface": "HF_TOKEN",
+}
+_BASE_URL_VAR = {
+    "openai": "OPENAI_BASE_URL",
+    "ollama": "OLLAMA_BASE_URL",
+}
+# Providers whose pydantic-ai model-string prefix differs from their name
+_MODEL_PREFIX = {
+    "gemini": "google-gla",
+}
+
+# Agents reused across CodeReviewer instances, keyed by (model, prompt).
+# Agent construction walks the CodeReviewResponse schema each time, which is
+# the expensive part of reviewer setup in long-running / repeated use.
+_AGENT_CACHE: dict = {}
+
+
+def _iter_lines(text: str):
+    """Yield lines exactly like text.split('\\n') without building the list."""
+    find = text.find
+    start = 0
+    while True:
+        end = find('\n', start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+class CodeReviewer:
+    """AI-powered code reviewer supporting multiple model providers."""
+
+    def __init__(self, config: ReviewConfig):
+        """Initialize the code reviewer with configuration."""
+        # pydantic-ai pulls in every provider SDK; defer the import until a
+        # reviewer is actually constructed so module import stays cheap
+        from pydantic_ai import Agent
+        from pydantic_ai.output import PromptedOutput
+
+        self.config = config
+        self.model = self._create_model()
+
+        # Compile all ignore patterns into one regex so each file check is a
+        # single match instead of a per-pattern fnmatch scan
+        patterns = config.ignore_patterns or []
+        self._ignore_re = (
+            re.compile('|'.join(f'(?:{fnmatch.translate(p)})' for p in patterns))
+            if patterns
+            else None
+        )
+
+        # Use PromptedOutput for HuggingFace models that may not support tool calling
+        # This uses prompt engineering + JSON mode instead of tool calls
+        if self.config.model_provider == "huggingface":
+            output_type = PromptedOutput(
+                CodeReviewResponse,
+                name="code_review",
+                description="Structured code review with categorized feedback"
+            )
+        else:
+            # Use default tool-based output for other providers
+            output_type = CodeReviewResponse
+
+        # Use custom prompt if provided, otherwise use default
+        system_prompt = self.config.custom_prompt or SYSTEM_PROMPT
+
+        cache_key = (self.model, system_prompt)
+        agent = _AGENT_CACHE.get(cache_key)
+        if agent is None:
+            agent = Agent(
+                self.model,
+                output_type=output_type,
+                system_prompt=system_prompt,
+            )
+            _AGENT_CACHE[cache_key] = agent
+        self.agent = agent
+
+    def _create_model(self) -> str:
+        """Create the appropriate model string based on provider configuration."""
+        provider = self.config.model_provider
+        model_name = self.config.model_name
+
+        # Set environment variables for API keys / base URLs if provided;
+        # pydantic-ai reads them from the environment
+        if self.config.api_key and (key_var := _API_KEY_VAR.get(provider)):
+            os.environ[key_var] = self.config.api_key
+        if self.config.base_url and (url_var := _BASE_URL_VAR.get(provider)):
+            os.environ[url_var] = self.config.base_url
+
+        return f"{_MODEL_PREFIX.get(provider, provider)}:{model_name}"
+
+    def should_ignore_file(self, file_path: str) -> bool:
+        """Check if file should be ignored based on patterns."""
+        return self._ignore_re is not None and self._ignore_re.match(file_path) is not None
+
+    def should_ignore_files(self, file_paths: Iterable[str]) -> list[bool]:
+        """Check a batch of file paths against the ignore patterns."""
+        if self._ignore_re is None:
+            return [False for _ in file_paths]
+        match = self._ignore_re.match
+        return [match(path) is not None for path in file_paths]
+
+    def annotate_diff_with_line_numbers(self, diff: str) -> str:
+        """
+        Annotate a diff with explicit line numbers to help AI accuracy.
+
+        Transforms:
+        ```diff
+        @@ -76,14 +76,15 @@
+         @classmethod
+        +        ignore_patterns=...
+        ```
+
+        Into:
+        ```diff
+        @@ -76,14 +76,15 @@
+        [Line 76]  @classmethod
+        [Line 87] +        ignore_patterns=...
+        ```
+        """
+        result = []
+        current_line = None
+
+        for line in _iter_lines(diff):
+            # Classify on the first character instead of chained startswith calls
+            first = line[:1]
+
+            # Check for diff header to reset line counter
+            if first == '@' and line.startswith('@@'):
+                result.append(line)
+                # Extract the new file starting line number
+                match = _HUNK_RE.match(line)
+                current_line = int(match.group(1)) if match else None
+                continue
+
+            if current_line is None:
+                # Before any @@ header, just pass through
+                result.append(line)
+            elif first == '+' or first == ' ':
+                # Additions and context lines exist in the new file: count them
+                result.append(f"[Line {current_line}] {line}")
+                current_line += 1
+            else:
+                # Deletions, empty lines, or other content: don't count
+                result.append(line)
+
+        return '\n'.join(result)
+
+    async def review_changes(
+        self,
+        file_changes: dict[str, str],
+        pr_title: str = "",
+        pr_description: str = "",
+    ) -> CodeReviewResponse:
+        """
+        Review code changes and return structured feedback.
+
+        Args:
+            file_changes: Dict mapping file paths to their diff content
+            pr_title: Optional PR title for context
+            pr_description: Optional PR description for context
+
+        Returns:
+            CodeReviewResponse with summary and comments
+        """
+        # Filter out ignored files and large files
+        filtered_changes = {}
+        for path, diff in file_changes.items():
+            if self.should_ignore_file(path):
+                continue
+            if len(diff) > self.config.max_file_size:
+                continue
+            filtered_changes[path] = diff
+
+        if not filtered_changes:
+            return CodeReviewResponse(
+                summary="No files to review (all files filtered out).",
+                comments=[],
+                approved=True,
+            )
+
+        batches = self._batch_files(filtered_changes)
+        prompts = [self._build_prompt(batch, pr_title, pr_description) for batch in batches]
+
+        # Fast path: small PRs fit in a single call
+        if len(prompts) == 1:
+            result = await self.agent.run(prompts[0])
+            return result.output
+
+        # Run batches concurrently so wall-clock is bounded by the slowest
+        # batch rather than the sum of all LLM roundtrips
+        results = await asyncio.gather(
+            *(self.agent.run(prompt) for prompt in prompts),
+            return_exceptions=True,
+        )
+
+        outputs = [r.output for r in results if not isinstance(r, BaseException)]
+        if not outputs:
+            # Every batch failed; surface the first error
+            raise next(r for r in results if isinstance(r, BaseException))
+
+        return CodeReviewResponse(
+            summary="\n\n".join(output.summary for output in outputs),
+            comments=[comment for output in outputs for comment in output.comments],
+            approved=all(output.approved for output in outputs),
+        )
+
+    def _batch_files(
+        self,
+        filtered_changes: dict[str, str],
+        byte_budget: int = BATCH_BYTE_BUDGET,
+    ) -> list[list[tuple[str, str]]]:
+        """
+        Greedily pack (path, diff) pairs into byte-budgeted batches.
+
+        Files are cohorted by top-level directory so related changes tend to
+        land in the same prompt, which gives the model cross-file context and
+        keeps per-batch PR narratives coherent.
+        """
+        ordered = sorted(
+            filtered_changes.items(),
+            key=lambda item: (item[0].split('/', 1)[0], item[0]),
+        )
+
+        batches: list[list[tuple[str, str]]] = []
+        current: list[tuple[str, str]] = []
+        current_size = 0
+
+        for path, diff in ordered:
+            if current and current_size + len(diff) > byte_budget:
+                batches.append(current)
+                current = []
+                current_size = 0
+            current.append((path, diff))
+            current_size += len(diff)
+
+        if current:
+            batches.append(current)
+
+        return batches
+
+    def _build_prompt(
+        self,
+        batch: list[tuple[str, str]],
+        pr_title: str,
+        pr_description: str,
+    ) -> str:
+        """Build the review prompt for one batch of file diffs."""
+        # Write straight into a string buffer; no intermediate list of parts
+        # plus a final join pass over the whole prompt
+        buf = io.StringIO()
+        write = buf.write
+
+        if pr_title:
+            write(f"PR Title: {pr_title}\n")
+        if pr_description:
+            write(f"PR Description: {pr_description}\n")
+
+        write("\n## Code Changes\n")
+
+        for path, diff in batch:
+            write(f"\n### File: {path}\n\n```diff\n")
+            # Annotate diff with explicit line numbers for accuracy; diffs
+            # without hunk headers (e.g. binary-file notices) have nothing to
+            # number, so skip the line walk entirely
+            if '@@' in diff:
+                write(self.annotate_diff_with_line_numbers(diff))
+            else:
+                write(diff)
+            write("\n```\n")
+
+        return buf.getvalue()
@@ -1,20 +1,25 @@
 """Pytest fixtures for tests."""
 
 import pytest
-import importlib
 
-models = importlib.import_module('any-llm-code-review.models')
-config = importlib.import_module('any-llm-code-review.config')
+from any_llm_code_review.config import ReviewConfig
+from any_llm_code_review.models import CodeReviewResponse, ReviewComment
+from any_llm_code_review.reviewer import CodeReviewer
 
-ReviewComment = models.ReviewComment
-CodeReviewResponse = models.CodeReviewResponse
-ReviewConfig = config.ReviewConfig
+
+@pytest.fixture
+def set_env(monkeypatch):
+    """Set several environment variables in one call."""
+    def _set(**env):
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+    return _set
 
 
 @pytest.fixture
 def sample_review_comment():
-    """Sample ReviewComment for testing."""
-    return ReviewComment(
+    """Sample ReviewComment for testing; trusted data, skips validation."""
+    return ReviewComment.model_construct(
         path="src/example.py",
         line=10,
         severity="warning",
@@ -26,11 +31,11 @@ def sample_review_comment():
 
 @pytest.fixture
 def sample_code_review_response():
-    """Sample CodeReviewResponse for testing."""
-    return CodeReviewResponse(
+    """Sample CodeReviewResponse for testing; trusted data, skips validation."""
+    return CodeReviewResponse.model_construct(
         summary="Overall the code looks good with minor improvements needed.",
         comments=[
-            ReviewComment(
+            ReviewComment.model_construct(
                 path="src/example.py",
                 line=10,
                 severity="warning",
@@ -38,21 +43,22 @@ def sample_code_review_response():
                 message="This loop could be optimized",
                 suggestion="Use list comprehension instead"
             ),
-            ReviewComment(
+            ReviewComment.model_construct(
                 path="src/example.py",
                 line=25,
                 severity="error",
                 category="bug",
                 message="Potential null pointer exception",
+                suggestion=None
             )
         ],
         approved=False
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_review_config():
-    """Sample ReviewConfig for testing."""
+    """Sample ReviewConfig for testing; frozen, so safe to share."""
     return ReviewConfig(
         model_provider="openai",
         model_name="gpt-4",
@@ -63,6 +69,12 @@ def sample_review_config():
     )
 
 
+@pytest.fixture(scope="session")
+def shared_reviewer(sample_review_config):
+    """A CodeReviewer over the default config, built once per session."""
+    return CodeReviewer(sample_review_config)
+
+
 @pytest.fixture
 def sample_diff():
     """Sample git diff for testing."""
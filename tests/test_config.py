@@ -1,23 +1,33 @@
 """Tests for config.py."""
 
 import pytest
-import importlib
 from pydantic import ValidationError
 
-config_module = importlib.import_module('any-llm-code-review.config')
-ReviewConfig = config_module.ReviewConfig
+from any_llm_code_review.config import ReviewConfig
+
+
+@pytest.fixture(scope="module")
+def base_kwargs():
+    """Minimal required ReviewConfig kwargs, shared across the module."""
+    return {
+        "model_provider": "openai",
+        "model_name": "gpt-4",
+        "github_token": "test-token"
+    }
+
+
+@pytest.fixture(scope="class")
+def default_config(base_kwargs):
+    """A minimal ReviewConfig built once per class for default checks."""
+    return ReviewConfig.model_construct(**base_kwargs)
 
 
 class TestReviewConfig:
     """Tests for ReviewConfig model."""
 
-    def test_create_config_with_minimal_fields(self):
-        """Test creating a ReviewConfig with minimal required fields."""
-        config = ReviewConfig(
-            model_provider="openai",
-            model_name="gpt-4",
-            github_token="test-token"
-        )
+    def test_defaults(self, default_config):
+        """Test that a minimal config carries the documented defaults."""
+        config = default_config
 
         assert config.model_provider == "openai"
         assert config.model_name == "gpt-4"
@@ -25,6 +35,11 @@ class TestReviewConfig:
         assert config.api_key is None
         assert config.max_tokens == 4000
         assert config.temperature == 0.3
+        assert config.review_title == "AI Code Review"
+        assert "*.md" in config.ignore_patterns
+        assert "*.json" in config.ignore_patterns
+        assert "package-lock.json" in config.ignore_patterns
+        assert "yarn.lock" in config.ignore_patterns
 
     def test_create_config_with_all_fields(self, sample_review_config):
         """Test creating a ReviewConfig with all fields."""
@@ -35,27 +50,9 @@ class TestReviewConfig:
         assert sample_review_config.max_tokens == 4000
         assert sample_review_config.temperature == 0.3
 
-    def test_default_ignore_patterns(self):
-        """Test that default ignore patterns are set correctly."""
-        config = ReviewConfig(
-            model_provider="openai",
-            model_name="gpt-4",
-            github_token="test-token"
-        )
-
-        assert "*.md" in config.ignore_patterns
-        assert "*.json" in config.ignore_patterns
-        assert "package-lock.json" in config.ignore_patterns
-        assert "yarn.lock" in config.ignore_patterns
-
-    def test_custom_ignore_patterns(self):
+    def test_custom_ignore_patterns(self, base_kwargs):
         """Test setting custom ignore patterns."""
-        config = ReviewConfig(
-            model_provider="openai",
-            model_name="gpt-4",
-            github_token="test-token",
-            ignore_patterns=["*.txt", "*.log"]
-        )
+        config = ReviewConfig(**base_kwargs, ignore_patterns=["*.txt", "*.log"])
 
         assert config.ignore_patterns == ["*.txt", "*.log"]
 
@@ -71,26 +68,16 @@ class TestReviewConfig:
 
         assert config.custom_prompt == custom_prompt
 
-    def test_review_title(self):
+    def test_review_title(self, base_kwargs):
         """Test setting a custom review title."""
-        config = ReviewConfig(
-            model_provider="openai",
-            model_name="gpt-4",
-            github_token="test-token",
-            review_title="Security Review"
-        )
+        config = ReviewConfig(**base_kwargs, review_title="Security Review")
 
         assert config.review_title == "Security Review"
 
-    def test_default_review_title(self):
-        """Test default review title."""
-        config = ReviewConfig(
-            model_provider="openai",
-            model_name="gpt-4",
-            github_token="test-token"
-        )
-
-        assert config.review_title == "AI Code Review"
+    def test_config_is_frozen(self, sample_review_config):
+        """Test that configs are immutable after construction."""
+        with pytest.raises(ValidationError):
+            sample_review_config.model_provider = "anthropic"
 
     def test_invalid_model_provider(self):
         """Test that invalid model provider raises ValidationError."""
@@ -101,40 +88,28 @@ class TestReviewConfig:
                 github_token="test-token"
             )
 
-    def test_valid_model_providers(self):
+    @pytest.mark.parametrize("provider", [
+        "openai", "anthropic", "gemini", "groq", "mistral",
+        "cohere", "bedrock", "vertexai", "ollama", "huggingface"
+    ])
+    def test_valid_model_providers(self, provider):
         """Test all valid model providers."""
-        providers = [
-            "openai", "anthropic", "gemini", "groq", "mistral",
-            "cohere", "bedrock", "vertexai", "ollama", "huggingface"
-        ]
-
-        for provider in providers:
-            config = ReviewConfig(
-                model_provider=provider,
-                model_name="test-model",
-                github_token="test-token"
-            )
-            assert config.model_provider == provider
-
-    def test_temperature_range(self):
-        """Test that temperature can be set within valid range."""
         config = ReviewConfig(
-            model_provider="openai",
-            model_name="gpt-4",
-            github_token="test-token",
-            temperature=0.5
+            model_provider=provider,
+            model_name="test-model",
+            github_token="test-token"
         )
+        assert config.model_provider == provider
+
+    def test_temperature_range(self, base_kwargs):
+        """Test that temperature can be set within valid range."""
+        config = ReviewConfig(**base_kwargs, temperature=0.5)
 
         assert config.temperature == 0.5
 
-    def test_max_file_size(self):
+    def test_max_file_size(self, base_kwargs):
         """Test setting max file size."""
-        config = ReviewConfig(
-            model_provider="openai",
-            model_name="gpt-4",
-            github_token="test-token",
-            max_file_size=20000
-        )
+        config = ReviewConfig(**base_kwargs, max_file_size=20000)
 
         assert config.max_file_size == 20000
 
@@ -142,19 +117,21 @@ class TestReviewConfig:
 class TestReviewConfigFromEnv:
     """Tests for ReviewConfig.from_env() class method."""
 
-    def test_from_env_with_all_variables(self, monkeypatch):
+    def test_from_env_with_all_variables(self, set_env):
         """Test creating config from environment variables with all vars set."""
-        monkeypatch.setenv("MODEL_PROVIDER", "anthropic")
-        monkeypatch.setenv("MODEL_NAME", "claude-3-5-sonnet-20241022")
-        monkeypatch.setenv("API_KEY", "test-api-key")
-        monkeypatch.setenv("BASE_URL", "https://api.example.com")
-        monkeypatch.setenv("MAX_TOKENS", "8000")
-        monkeypatch.setenv("TEMPERATURE", "0.5")
-        monkeypatch.setenv("GITHUB_TOKEN", "github-token")
-        monkeypatch.setenv("IGNORE_PATTERNS", "*.txt,*.log")
-        monkeypatch.setenv("MAX_FILE_SIZE", "15000")
-        monkeypatch.setenv("CUSTOM_PROMPT", "Custom prompt text")
-        monkeypatch.setenv("REVIEW_TITLE", "Security Review")
+        set_env(
+            MODEL_PROVIDER="anthropic",
+            MODEL_NAME="claude-3-5-sonnet-20241022",
+            API_KEY="test-api-key",
+            BASE_URL="https://api.example.com",
+            MAX_TOKENS="8000",
+            TEMPERATURE="0.5",
+            GITHUB_TOKEN="github-token",
+            IGNORE_PATTERNS="*.txt,*.log",
+            MAX_FILE_SIZE="15000",
+            CUSTOM_PROMPT="Custom prompt text",
+            REVIEW_TITLE="Security Review"
+        )
 
         config = ReviewConfig.from_env()
 
@@ -1,21 +1,18 @@
 """Tests for github_integration.py."""
 
-import json
-import pytest
-import importlib
-from unittest.mock import Mock, MagicMock, patch, mock_open
+from types import SimpleNamespace
 
-github_module = importlib.import_module('any-llm-code-review.github_integration')
-models_module = importlib.import_module('any-llm-code-review.models')
+import pytest
+from unittest.mock import ANY, Mock, MagicMock, patch, mock_open
 
-GitHubReviewPoster = github_module.GitHubReviewPoster
-CodeReviewResponse = models_module.CodeReviewResponse
-ReviewComment = models_module.ReviewComment
+from any_llm_code_review import github_integration as github_module
+from any_llm_code_review.github_integration import GitHubReviewPoster
+from any_llm_code_review.models import CodeReviewResponse, ReviewComment
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_github():
-    """Mock GitHub API objects."""
+    """Mock GitHub API objects, built once per module and reset between tests."""
     with patch.object(github_module, 'Github') as mock_gh:
         mock_repo = Mock()
         mock_pr = Mock()
@@ -32,6 +29,71 @@ def mock_github():
         }
 
 
+EVENT_BYTES_789 = b'{"pull_request":{"number":789}}'
+
+
+@pytest.fixture(scope="session")
+def event_json_path(tmp_path_factory):
+    """Path to an event payload file, written once per session."""
+    event_file = tmp_path_factory.mktemp("event") / "event.json"
+    event_file.write_bytes(EVENT_BYTES_789)
+    return str(event_file)
+
+
+@pytest.fixture(scope="module")
+def sample_error_comment():
+    """An error-severity review comment, shared across the module."""
+    return ReviewComment(
+        path="src/main.py",
+        line=10,
+        severity="error",
+        category="bug",
+        message="Potential null pointer exception",
+        suggestion="Add null check"
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_warning_comment():
+    """A warning-severity review comment, shared across the module."""
+    return ReviewComment(
+        path="src/utils.py",
+        line=5,
+        severity="warning",
+        category="performance",
+        message="This could be optimized"
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_github(mock_github):
+    """Clear call history and per-test side effects on the shared mocks."""
+    yield
+    for mock in mock_github.values():
+        mock.reset_mock(return_value=False, side_effect=True)
+    # Plain attributes aren't touched by reset_mock; restore the defaults
+    mock_github['pr'].title = "Test PR"
+    mock_github['pr'].body = "Test PR description"
+
+
+@pytest.fixture(scope="class")
+def poster(mock_github):
+    """A GitHubReviewPoster built once per test class."""
+    return GitHubReviewPoster(
+        token="test-token",
+        repository="owner/repo",
+        pr_number=123
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_poster_cache(request):
+    """Drop the shared poster's diff cache before tests that use it."""
+    if "poster" in request.fixturenames:
+        request.getfixturevalue("poster")._file_diffs = None
+    yield
+
+
 class TestGitHubReviewPoster:
     """Tests for GitHubReviewPoster class."""
 
@@ -45,7 +107,9 @@ class TestGitHubReviewPoster:
 
         assert poster.pr_number == 123
         assert poster.review_title == "AI Code Review"
-        mock_github['github'].assert_called_once_with("test-token")
+        mock_github['github'].assert_called_once_with(
+            "test-token", retry=ANY, pool_size=20, per_page=100
+        )
         mock_github['github'].return_value.get_repo.assert_called_once_with("owner/repo")
         mock_github['repo'].get_pull.assert_called_once_with(123)
 
@@ -60,28 +124,20 @@ class TestGitHubReviewPoster:
 
         assert poster.review_title == "Security Review"
 
-    def test_get_pr_files(self, mock_github):
+    def test_get_pr_files(self, mock_github, poster):
         """Test getting PR files and their diffs."""
-        mock_file1 = Mock()
-        mock_file1.filename = "src/main.py"
-        mock_file1.patch = "@@ -1,3 +1,4 @@\n def main():\n+    print('hello')\n     pass"
-
-        mock_file2 = Mock()
-        mock_file2.filename = "src/utils.py"
-        mock_file2.patch = "@@ -1,2 +1,3 @@\n def util():\n+    return True\n     pass"
-
-        mock_file3 = Mock()
-        mock_file3.filename = "image.png"
-        mock_file3.patch = None
+        mock_file1 = SimpleNamespace(
+            filename="src/main.py",
+            patch="@@ -1,3 +1,4 @@\n def main():\n+    print('hello')\n     pass"
+        )
+        mock_file2 = SimpleNamespace(
+            filename="src/utils.py",
+            patch="@@ -1,2 +1,3 @@\n def util():\n+    return True\n     pass"
+        )
+        mock_file3 = SimpleNamespace(filename="image.png", patch=None)
 
         mock_github['pr'].get_files.return_value = [mock_file1, mock_file2, mock_file3]
 
-        poster = GitHubReviewPoster(
-            token="test-token",
-            repository="owner/repo",
-            pr_number=123
-        )
-
         file_diffs = poster.get_pr_files()
 
         assert len(file_diffs) == 2
@@ -90,14 +146,63 @@ class TestGitHubReviewPoster:
         assert "image.png" not in file_diffs
         assert "print('hello')" in file_diffs["src/main.py"]
 
-    def test_post_review_approved_no_comments(self, mock_github):
-        """Test posting a review that's approved with no comments."""
-        poster = GitHubReviewPoster(
-            token="test-token",
-            repository="owner/repo",
-            pr_number=123
+    def test_get_pr_files_with_max_chars(self, mock_github, poster):
+        """Test that oversized files are dropped before their patch is read."""
+        mock_file1 = SimpleNamespace(
+            filename="generated.py",
+            additions=5000,
+            deletions=5000,
+            patch="+huge"
+        )
+        mock_file2 = SimpleNamespace(
+            filename="src/main.py",
+            additions=2,
+            deletions=1,
+            patch="@@ -1,1 +1,2 @@\n def main():\n+    pass"
+        )
+
+        mock_github['pr'].get_files.return_value = [mock_file1, mock_file2]
+
+        file_diffs = poster.get_pr_files(max_chars=10000)
+
+        assert "generated.py" not in file_diffs
+        assert "src/main.py" in file_diffs
+
+    def test_get_pr_files_with_should_skip(self, mock_github, poster):
+        """Test that files matching should_skip are dropped at fetch time."""
+        mock_file1 = SimpleNamespace(
+            filename="README.md",
+            patch="@@ -1,1 +1,2 @@\n # Title\n+Added line"
+        )
+        mock_file2 = SimpleNamespace(
+            filename="src/main.py",
+            patch="@@ -1,1 +1,2 @@\n def main():\n+    pass"
         )
 
+        mock_github['pr'].get_files.return_value = [mock_file1, mock_file2]
+
+        file_diffs = poster.get_pr_files(should_skip=lambda path: path.endswith(".md"))
+
+        assert "README.md" not in file_diffs
+        assert "src/main.py" in file_diffs
+
+    async def test_get_pr_files_async_single_page_uses_sequential_path(self, mock_github, poster):
+        """Test that single-page PRs fall back to the sequential fetch."""
+        mock_file = SimpleNamespace(
+            filename="src/main.py",
+            patch="@@ -1,1 +1,2 @@\n def main():\n+    pass"
+        )
+
+        mock_github['pr'].changed_files = 2
+        mock_github['pr'].get_files.return_value = [mock_file]
+
+        file_diffs = await poster.get_pr_files_async()
+
+        assert file_diffs == {"src/main.py": mock_file.patch}
+        mock_github['pr'].get_files.assert_called_once()
+
+    def test_post_review_approved_no_comments(self, mock_github, poster):
+        """Test posting a review that's approved with no comments."""
         review = CodeReviewResponse(
             summary="Code looks great!",
             comments=[],
@@ -112,33 +217,12 @@ class TestGitHubReviewPoster:
         assert "Code looks great!" in call_args[1]['body']
         assert call_args[1]['event'] == "COMMENT"
 
-    def test_post_review_with_comments(self, mock_github):
+    def test_post_review_with_comments(self, mock_github, poster, sample_error_comment,
+                                       sample_warning_comment):
         """Test posting a review with inline comments."""
-        poster = GitHubReviewPoster(
-            token="test-token",
-            repository="owner/repo",
-            pr_number=123
-        )
-
         review = CodeReviewResponse(
             summary="Found some issues",
-            comments=[
-                ReviewComment(
-                    path="src/main.py",
-                    line=10,
-                    severity="error",
-                    category="bug",
-                    message="Potential null pointer exception",
-                    suggestion="Add null check"
-                ),
-                ReviewComment(
-                    path="src/utils.py",
-                    line=5,
-                    severity="warning",
-                    category="performance",
-                    message="This could be optimized"
-                )
-            ],
+            comments=[sample_error_comment, sample_warning_comment],
             approved=False
         )
 
@@ -167,38 +251,23 @@ class TestGitHubReviewPoster:
         assert "⚠️" in comments[1]['body']
         assert "PERFORMANCE" in comments[1]['body']
 
-    def test_post_review_severity_emojis(self, mock_github):
-        """Test that correct emojis are used for different severity levels."""
-        poster = GitHubReviewPoster(
-            token="test-token",
-            repository="owner/repo",
-            pr_number=123
-        )
-
+    @pytest.mark.parametrize("severity, category, emoji", [
+        ("error", "bug", "🚨"),
+        ("warning", "style", "⚠️"),
+        ("info", "suggestion", "💡"),
+    ])
+    def test_severity_emoji(self, mock_github, poster, sample_error_comment,
+                            severity, category, emoji):
+        """Test that the correct emoji is used for each severity level."""
         review = CodeReviewResponse(
             summary="Various issues",
             comments=[
-                ReviewComment(
-                    path="src/main.py",
-                    line=1,
-                    severity="error",
-                    category="bug",
-                    message="Error message"
-                ),
-                ReviewComment(
-                    path="src/main.py",
-                    line=2,
-                    severity="warning",
-                    category="style",
-                    message="Warning message"
-                ),
-                ReviewComment(
-                    path="src/main.py",
-                    line=3,
-                    severity="info",
-                    category="suggestion",
-                    message="Info message"
-                )
+                sample_error_comment.model_copy(update={
+                    "line": 1,
+                    "severity": severity,
+                    "category": category,
+                    "message": f"{severity.capitalize()} message"
+                })
             ],
             approved=False
         )
@@ -206,29 +275,17 @@ class TestGitHubReviewPoster:
         poster.post_review(review)
 
         comments = mock_github['pr'].create_review.call_args[1]['comments']
+        assert emoji in comments[0]['body']
 
-        assert "🚨" in comments[0]['body']
-        assert "⚠️" in comments[1]['body']
-        assert "💡" in comments[2]['body']
-
-    def test_post_review_fallback_to_issue_comment(self, mock_github):
+    def test_post_review_fallback_to_issue_comment(self, mock_github, poster, sample_error_comment):
         """Test fallback to issue comment when review creation fails."""
-        poster = GitHubReviewPoster(
-            token="test-token",
-            repository="owner/repo",
-            pr_number=123
-        )
-
         review = CodeReviewResponse(
             summary="Review summary",
             comments=[
-                ReviewComment(
-                    path="src/main.py",
-                    line=10,
-                    severity="error",
-                    category="bug",
-                    message="Error message"
-                )
+                sample_error_comment.model_copy(update={
+                    "message": "Error message",
+                    "suggestion": None
+                })
             ],
             approved=False
         )
@@ -246,60 +303,63 @@ class TestGitHubReviewPoster:
 class TestGitHubReviewPosterFromEnv:
     """Tests for GitHubReviewPoster.from_env() class method."""
 
-    def test_from_env_with_github_ref(self, mock_github, monkeypatch):
+    def test_from_env_with_github_ref(self, mock_github, set_env):
         """Test creating poster from environment with GITHUB_REF."""
-        monkeypatch.setenv("GITHUB_TOKEN", "test-token")
-        monkeypatch.setenv("GITHUB_REPOSITORY", "owner/repo")
-        monkeypatch.setenv("GITHUB_REF", "refs/pull/456/merge")
+        set_env(
+            GITHUB_TOKEN="test-token",
+            GITHUB_REPOSITORY="owner/repo",
+            GITHUB_REF="refs/pull/456/merge"
+        )
 
         poster = GitHubReviewPoster.from_env()
 
         assert poster.pr_number == 456
 
-    def test_from_env_with_event_path(self, mock_github, monkeypatch, tmp_path):
+    def test_from_env_with_event_path(self, mock_github, set_env, event_json_path):
         """Test creating poster from environment with event payload."""
-        monkeypatch.setenv("GITHUB_TOKEN", "test-token")
-        monkeypatch.setenv("GITHUB_REPOSITORY", "owner/repo")
-        monkeypatch.setenv("GITHUB_REF", "refs/heads/main")
-        event_file = tmp_path / "event.json"
-        event_data = {
-            "pull_request": {
-                "number": 789
-            }
-        }
-        event_file.write_text(json.dumps(event_data))
-        monkeypatch.setenv("GITHUB_EVENT_PATH", str(event_file))
+        set_env(
+            GITHUB_TOKEN="test-token",
+            GITHUB_REPOSITORY="owner/repo",
+            GITHUB_REF="refs/heads/main",
+            GITHUB_EVENT_PATH=event_json_path
+        )
 
         poster = GitHubReviewPoster.from_env()
 
         assert poster.pr_number == 789
 
-    def test_from_env_with_custom_review_title(self, mock_github, monkeypatch):
+    def test_from_env_with_custom_review_title(self, mock_github, set_env):
         """Test creating poster with custom review title from env."""
-        monkeypatch.setenv("GITHUB_TOKEN", "test-token")
-        monkeypatch.setenv("GITHUB_REPOSITORY", "owner/repo")
-        monkeypatch.setenv("GITHUB_REF", "refs/pull/123/merge")
-        monkeypatch.setenv("REVIEW_TITLE", "Custom Review Title")
+        set_env(
+            GITHUB_TOKEN="test-token",
+            GITHUB_REPOSITORY="owner/repo",
+            GITHUB_REF="refs/pull/123/merge",
+            REVIEW_TITLE="Custom Review Title"
+        )
 
         poster = GitHubReviewPoster.from_env()
 
         assert poster.review_title == "Custom Review Title"
 
-    def test_from_env_missing_pr_number(self, mock_github, monkeypatch):
+    def test_from_env_missing_pr_number(self, mock_github, set_env, monkeypatch):
         """Test that missing PR number raises error."""
-        monkeypatch.setenv("GITHUB_TOKEN", "test-token")
-        monkeypatch.setenv("GITHUB_REPOSITORY", "owner/repo")
-        monkeypatch.setenv("GITHUB_REF", "refs/heads/main")
+        set_env(
+            GITHUB_TOKEN="test-token",
+            GITHUB_REPOSITORY="owner/repo",
+            GITHUB_REF="refs/heads/main"
+        )
         monkeypatch.delenv("GITHUB_EVENT_PATH", raising=False)
 
         with pytest.raises(ValueError, match="Could not determine PR number"):
             GitHubReviewPoster.from_env()
 
-    def test_from_env_default_review_title(self, mock_github, monkeypatch):
+    def test_from_env_default_review_title(self, mock_github, set_env, monkeypatch):
         """Test default review title when not specified."""
-        monkeypatch.setenv("GITHUB_TOKEN", "test-token")
-        monkeypatch.setenv("GITHUB_REPOSITORY", "owner/repo")
-        monkeypatch.setenv("GITHUB_REF", "refs/pull/123/merge")
+        set_env(
+            GITHUB_TOKEN="test-token",
+            GITHUB_REPOSITORY="owner/repo",
+            GITHUB_REF="refs/pull/123/merge"
+        )
         monkeypatch.delenv("REVIEW_TITLE", raising=False)
 
         poster = GitHubReviewPoster.from_env()
@@ -1,18 +1,37 @@
 """Tests for main.py CLI and integration."""
 
+import click
 import pytest
-import importlib
 from unittest.mock import Mock, AsyncMock, patch
 from click.testing import CliRunner
 
-main_module = importlib.import_module('any-llm-code-review.main')
-models_module = importlib.import_module('any-llm-code-review.models')
-
-cli = main_module.cli
-review_pr = main_module.review_pr
-review_pr_from_env = main_module.review_pr_from_env
-CodeReviewResponse = models_module.CodeReviewResponse
-ReviewComment = models_module.ReviewComment
+from any_llm_code_review import main as main_module
+from any_llm_code_review.main import cli, review_pr, review_pr_from_env
+from any_llm_code_review.models import CodeReviewResponse, ReviewComment
+
+
+ARGS_FULL = (
+    'review',
+    '--provider', 'openai',
+    '--model', 'gpt-4',
+    '--api-key', 'test-key',
+    '--github-token', 'gh-token',
+    '--repository', 'owner/repo',
+    '--pr-number', '123',
+    '--max-tokens', '8000',
+    '--temperature', '0.5',
+    '--custom-prompt', 'Custom prompt',
+    '--review-title', 'Custom Title'
+)
+
+ARGS_MIN = (
+    'review',
+    '--provider', 'openai',
+    '--model', 'gpt-4',
+    '--github-token', 'gh-token',
+    '--repository', 'owner/repo',
+    '--pr-number', '123'
+)
 
 
 @pytest.fixture
@@ -21,9 +40,26 @@ def cli_runner():
     return CliRunner()
 
 
-@pytest.fixture
+def _wire_review_components(components):
+    """(Re)apply the canonical wiring to the shared component mocks."""
+    reviewer_instance = components['reviewer_instance']
+    poster_instance = components['poster_instance']
+
+    poster_instance.get_pr_meta.return_value = ("Test PR", "Test description")
+    poster_instance.get_pr_files.return_value = {
+        "src/test.py": "@@ -1,1 +1,2 @@\n def test():\n+    pass"
+    }
+    poster_instance.get_pr_files_async = AsyncMock(
+        side_effect=lambda **kwargs: poster_instance.get_pr_files()
+    )
+    reviewer_instance.review_changes = AsyncMock(
+        return_value=components['review_result']
+    )
+
+
+@pytest.fixture(scope="module")
 def mock_review_components():
-    """Mock the main components for review."""
+    """Mock the main components for review, shared across the module."""
     with patch.object(main_module, 'CodeReviewer') as mock_reviewer, \
          patch.object(main_module, 'GitHubReviewPoster') as mock_poster:
 
@@ -31,50 +67,53 @@ def mock_review_components():
         mock_reviewer.return_value = mock_reviewer_instance
 
         mock_poster_instance = Mock()
-        mock_poster_instance.pr.title = "Test PR"
-        mock_poster_instance.pr.body = "Test description"
-        mock_poster_instance.get_pr_files.return_value = {
-            "src/test.py": "@@ -1,1 +1,2 @@\n def test():\n+    pass"
-        }
         mock_poster.return_value = mock_poster_instance
 
-        mock_review_result = CodeReviewResponse(
-            summary="Code looks good",
-            comments=[],
-            approved=True
-        )
-        mock_reviewer_instance.review_changes = AsyncMock(return_value=mock_review_result)
-
-        yield {
+        components = {
             'reviewer_class': mock_reviewer,
             'reviewer_instance': mock_reviewer_instance,
             'poster_class': mock_poster,
             'poster_instance': mock_poster_instance,
-            'review_result': mock_review_result
+            'review_result': CodeReviewResponse(
+                summary="Code looks good",
+                comments=[],
+                approved=True
+            )
         }
+        _wire_review_components(components)
+
+        yield components
+
+
+@pytest.fixture(autouse=True)
+def _reset_review_components(mock_review_components):
+    """Clear call history and per-test tweaks on the shared component mocks."""
+    yield
+    for key in ('reviewer_class', 'reviewer_instance', 'poster_class', 'poster_instance'):
+        mock_review_components[key].reset_mock(return_value=False, side_effect=True)
+    _wire_review_components(mock_review_components)
 
 
 class TestCLI:
     """Tests for CLI commands."""
 
-    def test_cli_group_exists(self, cli_runner):
+    def test_cli_group_exists(self):
         """Test that CLI group is accessible."""
-        result = cli_runner.invoke(cli, ['--help'])
-        assert result.exit_code == 0
-        assert "AI Code Reviewer" in result.output
+        help_text = cli.get_help(click.Context(cli))
+        assert "AI Code Reviewer" in help_text
 
-    def test_review_command_exists(self, cli_runner):
+    def test_review_command_exists(self):
         """Test that review command exists and shows help."""
-        result = cli_runner.invoke(cli, ['review', '--help'])
-        assert result.exit_code == 0
-        assert "--provider" in result.output
-        assert "--model" in result.output
-        assert "--github-token" in result.output
+        review_cmd = cli.commands["review"]
+        help_text = review_cmd.get_help(click.Context(review_cmd))
+        assert "--provider" in help_text
+        assert "--model" in help_text
+        assert "--github-token" in help_text
 
-    def test_review_from_env_command_exists(self, cli_runner):
+    def test_review_from_env_command_exists(self):
         """Test that review-from-env command exists."""
-        result = cli_runner.invoke(cli, ['review-from-env', '--help'])
-        assert result.exit_code == 0
+        review_from_env_cmd = cli.commands["review-from-env"]
+        assert review_from_env_cmd.get_help(click.Context(review_from_env_cmd))
 
 
 class TestReviewCommand:
@@ -82,19 +121,7 @@ class TestReviewCommand:
 
     def test_review_command_with_all_options(self, cli_runner, mock_review_components):
         """Test review command with all options."""
-        result = cli_runner.invoke(cli, [
-            'review',
-            '--provider', 'openai',
-            '--model', 'gpt-4',
-            '--api-key', 'test-key',
-            '--github-token', 'gh-token',
-            '--repository', 'owner/repo',
-            '--pr-number', '123',
-            '--max-tokens', '8000',
-            '--temperature', '0.5',
-            '--custom-prompt', 'Custom prompt',
-            '--review-title', 'Custom Title'
-        ])
+        result = cli_runner.invoke(cli, list(ARGS_FULL))
 
         assert result.exit_code == 0
         assert "Code looks good" in result.output
@@ -110,14 +137,7 @@ class TestReviewCommand:
 
     def test_review_command_with_minimal_options(self, cli_runner, mock_review_components):
         """Test review command with minimal required options."""
-        result = cli_runner.invoke(cli, [
-            'review',
-            '--provider', 'openai',
-            '--model', 'gpt-4',
-            '--github-token', 'gh-token',
-            '--repository', 'owner/repo',
-            '--pr-number', '123'
-        ])
+        result = cli_runner.invoke(cli, list(ARGS_MIN))
 
         assert result.exit_code == 0
 
@@ -125,7 +145,6 @@ class TestReviewCommand:
 class TestReviewPRFunction:
     """Tests for the review_pr async function."""
 
-    @pytest.mark.asyncio
     async def test_review_pr_success(self, mock_review_components):
         """Test successful PR review flow."""
         with pytest.raises(SystemExit) as exc_info:
@@ -144,7 +163,6 @@ class TestReviewPRFunction:
         mock_review_components['reviewer_instance'].review_changes.assert_called_once()
         mock_review_components['poster_instance'].post_review.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_review_pr_with_custom_options(self, mock_review_components):
         """Test PR review with custom options."""
         with pytest.raises(SystemExit) as exc_info:
@@ -171,7 +189,6 @@ class TestReviewPRFunction:
         assert call_args.temperature == 0.5
         assert call_args.custom_prompt == "Custom security review"
 
-    @pytest.mark.asyncio
     async def test_review_pr_with_comments(self, mock_review_components):
         """Test PR review with comments in the result."""
         review_with_comments = CodeReviewResponse(
@@ -210,7 +227,6 @@ class TestReviewPRFunction:
 
         assert exc_info.value.code == 1
 
-    @pytest.mark.asyncio
     async def test_review_pr_handles_exceptions(self, mock_review_components):
         """Test that exceptions are handled properly."""
         mock_review_components['poster_instance'].get_pr_files.side_effect = Exception("API Error")
@@ -231,39 +247,41 @@ class TestReviewPRFunction:
 class TestReviewPRFromEnv:
     """Tests for review_pr_from_env function."""
 
-    @pytest.mark.asyncio
-    async def test_review_pr_from_env_success(self, mock_review_components, monkeypatch):
+    async def test_review_pr_from_env_success(self, mock_review_components, set_env):
         """Test successful review from environment variables."""
-        monkeypatch.setenv("MODEL_PROVIDER", "openai")
-        monkeypatch.setenv("MODEL_NAME", "gpt-4")
-        monkeypatch.setenv("GITHUB_TOKEN", "gh-token")
-        monkeypatch.setenv("GITHUB_REPOSITORY", "owner/repo")
-        monkeypatch.setenv("GITHUB_REF", "refs/pull/123/merge")
-
-        with patch.object(main_module, 'ReviewConfig') as mock_config, \
-             patch.object(main_module, 'GitHubReviewPoster') as mock_poster:
-
-            mock_config.from_env.return_value = Mock()
-            mock_poster_instance = Mock()
-            mock_poster_instance.pr.title = "Test PR"
-            mock_poster_instance.pr.body = "Description"
-            mock_poster_instance.get_pr_files.return_value = {"test.py": "diff"}
-            mock_poster.from_env.return_value = mock_poster_instance
-
-            mock_reviewer = Mock()
-            mock_reviewer.review_changes = AsyncMock(return_value=CodeReviewResponse(
-                summary="Good",
-                comments=[],
-                approved=True
-            ))
+        set_env(
+            MODEL_PROVIDER="openai",
+            MODEL_NAME="gpt-4",
+            GITHUB_TOKEN="gh-token",
+            GITHUB_REPOSITORY="owner/repo",
+            GITHUB_REF="refs/pull/123/merge"
+        )
 
-            with patch.object(main_module, 'CodeReviewer', return_value=mock_reviewer):
-                with pytest.raises(SystemExit) as exc_info:
-                    await review_pr_from_env()
+        mock_poster_instance = Mock()
+        mock_poster_instance.get_pr_meta.return_value = ("Test PR", "Description")
+        mock_poster_instance.get_pr_files.return_value = {"test.py": "diff"}
+        mock_poster_instance.get_pr_files_async = AsyncMock(
+            side_effect=lambda **kwargs: mock_poster_instance.get_pr_files()
+        )
+
+        mock_reviewer = Mock()
+        mock_reviewer.review_changes = AsyncMock(return_value=CodeReviewResponse(
+            summary="Good",
+            comments=[],
+            approved=True
+        ))
+
+        with patch.multiple(
+            main_module,
+            ReviewConfig=Mock(from_env=Mock(return_value=Mock())),
+            GitHubReviewPoster=Mock(from_env=Mock(return_value=mock_poster_instance)),
+            CodeReviewer=Mock(return_value=mock_reviewer)
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                await review_pr_from_env()
 
-                assert exc_info.value.code == 0
+            assert exc_info.value.code == 0
 
-    @pytest.mark.asyncio
     async def test_review_pr_from_env_handles_errors(self, monkeypatch):
         """Test that errors are handled in review_pr_from_env."""
         with patch.object(main_module, 'ReviewConfig') as mock_config:
@@ -1,12 +1,14 @@
 """Tests for models.py."""
 
+import importlib.util
+
+import orjson
 import pytest
-import importlib
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
+
+from any_llm_code_review.models import CodeReviewResponse, ReviewComment
 
-models = importlib.import_module('any-llm-code-review.models')
-ReviewComment = models.ReviewComment
-CodeReviewResponse = models.CodeReviewResponse
+_CRR = TypeAdapter(CodeReviewResponse)
 
 
 class TestReviewComment:
@@ -42,25 +44,6 @@ class TestReviewComment:
 
         assert comment.suggestion is None
 
-    def test_severity_must_be_valid(self):
-        """Test that severity must be one of the allowed values."""
-        with pytest.raises(ValidationError):
-            ReviewComment(
-                path="src/test.py",
-                line=42,
-                severity="critical",
-                category="bug",
-                message="Test message"
-            )
-
-    def test_required_fields(self):
-        """Test that all required fields must be provided."""
-        with pytest.raises(ValidationError):
-            ReviewComment(
-                path="src/test.py",
-                line=42,
-            )
-
     def test_line_coerces_to_integer(self):
         """Test that line number coerces string to integer."""
         comment = ReviewComment(
@@ -74,6 +57,47 @@ class TestReviewComment:
         assert isinstance(comment.line, int)
 
 
+class TestSchemaBuild:
+    """Tests for schema-build configuration."""
+
+    @pytest.mark.parametrize("model_cls", [ReviewComment, CodeReviewResponse])
+    def test_defer_build_enabled(self, model_cls):
+        """Test that schema construction is deferred to first use."""
+        assert model_cls.model_config.get("defer_build") is True
+
+
+class TestValidationFailures:
+    """Tests for inputs the models must reject."""
+
+    @pytest.mark.parametrize("model_cls, kwargs", [
+        pytest.param(
+            ReviewComment,
+            {"path": "x", "line": 1, "severity": "critical",
+             "category": "bug", "message": "m"},
+            id="comment-invalid-severity"
+        ),
+        pytest.param(
+            ReviewComment,
+            {"path": "x", "line": 1},
+            id="comment-missing-required"
+        ),
+        pytest.param(
+            CodeReviewResponse,
+            {"summary": "s", "comments": ["bad"], "approved": True},
+            id="response-non-comment-list"
+        ),
+        pytest.param(
+            CodeReviewResponse,
+            {"summary": "s"},
+            id="response-missing-required"
+        ),
+    ])
+    def test_invalid_input_raises(self, model_cls, kwargs):
+        """Test that invalid or incomplete payloads raise ValidationError."""
+        with pytest.raises(ValidationError):
+            model_cls(**kwargs)
+
+
 class TestCodeReviewResponse:
     """Tests for CodeReviewResponse model."""
 
@@ -85,10 +109,10 @@ class TestCodeReviewResponse:
 
     def test_create_code_review_response_empty_comments(self):
         """Test creating a CodeReviewResponse with no comments."""
-        response = CodeReviewResponse(
-            summary="Code looks great!",
-            approved=True
-        )
+        response = _CRR.validate_python({
+            "summary": "Code looks great!",
+            "approved": True
+        })
 
         assert response.summary == "Code looks great!"
         assert response.comments == []
@@ -96,41 +120,67 @@ class TestCodeReviewResponse:
 
     def test_approved_must_be_boolean(self):
         """Test that approved must be a boolean (or coercible)."""
-        response = CodeReviewResponse(
-            summary="Test summary",
-            approved=True
-        )
+        response = _CRR.validate_python({
+            "summary": "Test summary",
+            "approved": True
+        })
         assert response.approved is True
         assert isinstance(response.approved, bool)
 
-    def test_comments_must_be_list_of_review_comments(self):
-        """Test that comments must be a list of ReviewComment objects."""
-        with pytest.raises(ValidationError):
-            CodeReviewResponse(
-                summary="Test summary",
-                comments=["invalid comment"],
-                approved=True
-            )
-
-    def test_required_fields_code_review_response(self):
-        """Test that required fields must be provided."""
-        with pytest.raises(ValidationError):
-            CodeReviewResponse(
-                summary="Test summary"
-            )
-
     def test_model_serialization(self, sample_review_comment):
         """Test that models can be serialized to dict."""
-        comment_dict = sample_review_comment.model_dump()
+        comment_dict = sample_review_comment.model_dump(mode="python", exclude_none=True)
 
         assert comment_dict["path"] == "src/example.py"
         assert comment_dict["line"] == 10
         assert comment_dict["severity"] == "warning"
 
+    def test_model_serialization_json_mode(self, sample_code_review_response):
+        """Test the JSON-mode dump path used for machine-readable output."""
+        response_dict = sample_code_review_response.model_dump(mode="json", exclude_none=True)
+
+        assert response_dict["approved"] is False
+        assert response_dict["comments"][1] == {
+            "path": "src/example.py",
+            "line": 25,
+            "severity": "error",
+            "category": "bug",
+            "message": "Potential null pointer exception",
+        }
+
     def test_model_json_serialization(self, sample_code_review_response):
-        """Test that models can be serialized to JSON."""
-        json_str = sample_code_review_response.model_dump_json()
+        """Test that models serialize to structurally correct JSON."""
+        json_str = sample_code_review_response.model_dump_json(exclude_none=True)
 
         assert isinstance(json_str, str)
-        assert "Overall the code looks good" in json_str
-        assert "src/example.py" in json_str
+        payload = orjson.loads(json_str)
+        assert payload["summary"].startswith("Overall the code looks good")
+        assert payload["comments"][0]["path"] == "src/example.py"
+        assert payload["approved"] is False
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(
+    importlib.util.find_spec("pytest_benchmark") is None,
+    reason="pytest-benchmark not installed"
+)
+class TestConstructionBenchmarks:
+    """Microbenchmarks pinning the model_construct vs validation gap."""
+
+    _COMMENT_DATA = {
+        "path": "x",
+        "line": 1,
+        "severity": "info",
+        "category": "style",
+        "message": "m"
+    }
+
+    def test_bench_model_construct(self, benchmark):
+        """Benchmark trusted construction without validation."""
+        comment = benchmark(lambda: ReviewComment.model_construct(**self._COMMENT_DATA))
+        assert comment.line == 1
+
+    def test_bench_model_validate(self, benchmark):
+        """Benchmark full validated construction for comparison."""
+        comment = benchmark(lambda: ReviewComment.model_validate(self._COMMENT_DATA))
+        assert comment.line == 1
@@ -1,17 +1,38 @@
 """Tests for reviewer.py."""
 
+import asyncio
+import types
+
 import pytest
-import importlib
-from unittest.mock import Mock, AsyncMock, patch
 
-reviewer_module = importlib.import_module('any-llm-code-review.reviewer')
-config_module = importlib.import_module('any-llm-code-review.config')
-models_module = importlib.import_module('any-llm-code-review.models')
+from any_llm_code_review.config import ReviewConfig
+from any_llm_code_review.models import CodeReviewResponse, ReviewComment
+from any_llm_code_review.reviewer import CodeReviewer
+
+
+_CUSTOM_PROMPT = "You are a security-focused reviewer."
+
 
-CodeReviewer = reviewer_module.CodeReviewer
-ReviewConfig = config_module.ReviewConfig
-CodeReviewResponse = models_module.CodeReviewResponse
-ReviewComment = models_module.ReviewComment
+@pytest.fixture(scope="module")
+def custom_prompt_reviewer():
+    """A reviewer configured with a custom system prompt."""
+    return CodeReviewer(ReviewConfig(
+        model_provider="openai",
+        model_name="gpt-4",
+        github_token="test-token",
+        custom_prompt=_CUSTOM_PROMPT
+    ))
+
+
+@pytest.fixture(scope="module")
+def custom_ignore_reviewer():
+    """A reviewer configured with custom ignore patterns."""
+    return CodeReviewer(ReviewConfig(
+        model_provider="openai",
+        model_name="gpt-4",
+        github_token="test-token",
+        ignore_patterns=["*.py", "test_*"]
+    ))
 
 
 class TestCodeReviewer:
@@ -25,41 +46,23 @@ class TestCodeReviewer:
         assert reviewer.model is not None
         assert reviewer.agent is not None
 
-    def test_create_model_openai(self):
-        """Test creating OpenAI model string."""
-        config = ReviewConfig(
-            model_provider="openai",
-            model_name="gpt-4",
-            github_token="test-token",
-            api_key="test-key"
-        )
-        reviewer = CodeReviewer(config)
-
-        assert reviewer.model == "openai:gpt-4"
-
-    def test_create_model_anthropic(self):
-        """Test creating Anthropic model string."""
-        config = ReviewConfig(
-            model_provider="anthropic",
-            model_name="claude-3-5-sonnet-20241022",
-            github_token="test-token",
-            api_key="test-key"
-        )
-        reviewer = CodeReviewer(config)
-
-        assert reviewer.model == "anthropic:claude-3-5-sonnet-20241022"
-
-    def test_create_model_gemini(self):
-        """Test creating Gemini model string."""
+    @pytest.mark.parametrize("provider, name, expected", [
+        ("openai", "gpt-4", "openai:gpt-4"),
+        ("anthropic", "claude-3-5-sonnet-20241022", "anthropic:claude-3-5-sonnet-20241022"),
+        ("gemini", "gemini-2.0-pro", "google-gla:gemini-2.0-pro"),
+        ("huggingface", "Qwen/Qwen2.5-72B-Instruct", "huggingface:Qwen/Qwen2.5-72B-Instruct"),
+    ])
+    def test_create_model(self, provider, name, expected):
+        """Test creating provider-prefixed model strings."""
         config = ReviewConfig(
-            model_provider="gemini",
-            model_name="gemini-2.0-pro",
+            model_provider=provider,
+            model_name=name,
             github_token="test-token",
             api_key="test-key"
         )
         reviewer = CodeReviewer(config)
 
-        assert reviewer.model == "google-gla:gemini-2.0-pro"
+        assert reviewer.model == expected
 
     @pytest.mark.skip(reason="Ollama model requires local Ollama installation")
     def test_create_model_ollama(self):
@@ -74,69 +77,41 @@ class TestCodeReviewer:
 
         assert reviewer.model == "ollama:llama3.1"
 
-    def test_create_model_huggingface(self):
-        """Test creating HuggingFace model string."""
-        config = ReviewConfig(
-            model_provider="huggingface",
-            model_name="Qwen/Qwen2.5-72B-Instruct",
-            github_token="test-token",
-            api_key="test-key"
-        )
-        reviewer = CodeReviewer(config)
-
-        assert reviewer.model == "huggingface:Qwen/Qwen2.5-72B-Instruct"
-
-    def test_custom_prompt_usage(self):
+    def test_custom_prompt_usage(self, custom_prompt_reviewer):
         """Test that custom prompt is used when provided."""
-        custom_prompt = "You are a security-focused reviewer."
-        config = ReviewConfig(
-            model_provider="openai",
-            model_name="gpt-4",
-            github_token="test-token",
-            custom_prompt=custom_prompt
-        )
-        reviewer = CodeReviewer(config)
-        assert reviewer.config.custom_prompt == custom_prompt
-        assert reviewer.agent is not None
-
-    def test_should_ignore_file_with_matching_pattern(self, sample_review_config):
-        """Test file filtering with ignore patterns."""
-        reviewer = CodeReviewer(sample_review_config)
-
-        assert reviewer.should_ignore_file("README.md") is True
-        assert reviewer.should_ignore_file("config.json") is True
-        assert reviewer.should_ignore_file("package-lock.json") is True
-
-    def test_should_not_ignore_file_without_matching_pattern(self, sample_review_config):
-        """Test that non-matching files are not ignored."""
-        reviewer = CodeReviewer(sample_review_config)
-
-        assert reviewer.should_ignore_file("src/main.py") is False
-        assert reviewer.should_ignore_file("lib/utils.js") is False
-
-    def test_should_ignore_file_custom_patterns(self):
+        assert custom_prompt_reviewer.config.custom_prompt == _CUSTOM_PROMPT
+        assert custom_prompt_reviewer.agent is not None
+
+    @pytest.mark.parametrize("path, expected", [
+        ("README.md", True),
+        ("config.json", True),
+        ("package-lock.json", True),
+        ("src/main.py", False),
+        ("lib/utils.js", False),
+    ])
+    def test_should_ignore_file(self, shared_reviewer, path, expected):
+        """Test file filtering against the default ignore patterns."""
+        assert shared_reviewer.should_ignore_file(path) is expected
+
+    def test_should_ignore_files_batch(self, shared_reviewer):
+        """Test checking many paths in one call."""
+        paths = ["README.md", "config.json", "package-lock.json",
+                 "src/main.py", "lib/utils.js"]
+
+        assert shared_reviewer.should_ignore_files(paths) == [
+            True, True, True, False, False
+        ]
+
+    def test_should_ignore_file_custom_patterns(self, custom_ignore_reviewer):
         """Test file filtering with custom patterns."""
-        config = ReviewConfig(
-            model_provider="openai",
-            model_name="gpt-4",
-            github_token="test-token",
-            ignore_patterns=["*.py", "test_*"]
-        )
-        reviewer = CodeReviewer(config)
+        reviewer = custom_ignore_reviewer
 
         assert reviewer.should_ignore_file("main.py") is True
         assert reviewer.should_ignore_file("test_something.js") is True
         assert reviewer.should_ignore_file("utils.js") is False
 
 
-class TestDiffAnnotation:
-    """Tests for diff annotation with line numbers."""
-
-    def test_annotate_diff_with_line_numbers(self, sample_review_config):
-        """Test that diffs are annotated with line numbers correctly."""
-        reviewer = CodeReviewer(sample_review_config)
-
-        diff = """@@ -1,5 +1,6 @@
+_SINGLE_HUNK_DIFF = """@@ -1,5 +1,6 @@
  def calculate_total(items):
      total = 0
      for item in items:
@@ -145,19 +120,7 @@ class TestDiffAnnotation:
      return total
 """
 
-        annotated = reviewer.annotate_diff_with_line_numbers(diff)
-
-        assert "[Line 1] " in annotated
-        assert "[Line 5] +" in annotated
-        assert "print(f\"Total: {total}\")" in annotated
-        assert "[Line 6]  " in annotated
-        assert "return total" in annotated
-
-    def test_annotate_diff_with_multiple_hunks(self, sample_review_config):
-        """Test annotation with multiple diff hunks."""
-        reviewer = CodeReviewer(sample_review_config)
-
-        diff = """@@ -10,3 +10,4 @@
+_MULTI_HUNK_DIFF = """@@ -10,3 +10,4 @@
  def func1():
      return 1
 +    # New comment
@@ -168,136 +131,162 @@ class TestDiffAnnotation:
      return 2
 """
 
-        annotated = reviewer.annotate_diff_with_line_numbers(diff)
-        assert "[Line 10] " in annotated
-        assert "[Line 12] +" in annotated
-        assert "[Line 21] " in annotated
-        assert "[Line 22] +" in annotated
-
-    def test_annotate_diff_handles_deletions(self, sample_review_config):
-        """Test that deletions are not numbered."""
-        reviewer = CodeReviewer(sample_review_config)
-
-        diff = """@@ -5,4 +5,3 @@
+_DELETION_DIFF = """@@ -5,4 +5,3 @@
  def example():
 -    old_code = True
      new_code = True
      return new_code
 """
 
-        annotated = reviewer.annotate_diff_with_line_numbers(diff)
-        assert "-    old_code = True" in annotated
+
+class TestDiffAnnotation:
+    """Tests for diff annotation with line numbers."""
+
+    @pytest.mark.parametrize("diff, expected", [
+        pytest.param(
+            _SINGLE_HUNK_DIFF,
+            ["[Line 1] ", "[Line 5] +", "print(f\"Total: {total}\")",
+             "[Line 6]  ", "return total"],
+            id="single-hunk"
+        ),
+        pytest.param(
+            _MULTI_HUNK_DIFF,
+            ["[Line 10] ", "[Line 12] +", "[Line 21] ", "[Line 22] +"],
+            id="multiple-hunks"
+        ),
+        pytest.param(
+            _DELETION_DIFF,
+            ["-    old_code = True", "[Line 6] "],
+            id="deletions"
+        ),
+    ])
+    def test_annotate_diff(self, shared_reviewer, diff, expected):
+        """Test that diffs are annotated with line numbers correctly."""
+        annotated = shared_reviewer.annotate_diff_with_line_numbers(diff)
+
+        for substring in expected:
+            assert substring in annotated
+
+    def test_annotate_diff_does_not_number_deletions(self, shared_reviewer):
+        """Test that deletion lines carry no line number."""
+        annotated = shared_reviewer.annotate_diff_with_line_numbers(_DELETION_DIFF)
+
         assert "[Line" not in annotated.split("\n")[2]  # The deletion line
-        assert "[Line 6] " in annotated
 
 
-class TestReviewChanges:
-    """Tests for review_changes method."""
+class _RunStub:
+    """Minimal async stand-in for agent.run that records its prompts."""
 
-    @pytest.mark.asyncio
-    async def test_review_changes_filters_ignored_files(self, sample_review_config):
-        """Test that ignored files are filtered out."""
-        reviewer = CodeReviewer(sample_review_config)
+    def __init__(self, output):
+        self.output = output
+        self.calls = []
 
-        file_changes = {
-            "README.md": "@@ -1,1 +1,2 @@\n # Title\n+Added line",
-            "src/main.py": "@@ -1,1 +1,2 @@\n def main():\n+    pass"
-        }
+    async def __call__(self, prompt, *args, **kwargs):
+        self.calls.append(prompt)
+        return types.SimpleNamespace(output=self.output)
 
-        with patch.object(reviewer.agent, 'run', new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = Mock(output=CodeReviewResponse(
-                summary="Looks good",
-                comments=[],
-                approved=True
-            ))
-            await reviewer.review_changes(file_changes)
-            call_args = mock_run.call_args[0][0]
-            assert "README.md" not in call_args
-            assert "src/main.py" in call_args
-
-    @pytest.mark.asyncio
-    async def test_review_changes_filters_large_files(self, sample_review_config):
-        """Test that files exceeding max_file_size are filtered out."""
-        reviewer = CodeReviewer(sample_review_config)
 
-        large_diff = "+" + ("x" * 20000)
+_LARGE_DIFF = "+" + "x" * 20000
 
-        file_changes = {
-            "large.py": large_diff,
-            "small.py": "@@ -1,1 +1,2 @@\n def small():\n+    pass"
-        }
+_SMALL_DIFF = "@@ -1,1 +1,2 @@\n def main():\n+    pass"
 
-        with patch.object(reviewer.agent, 'run', new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = Mock(output=CodeReviewResponse(
-                summary="Looks good",
-                comments=[],
-                approved=True
-            ))
-            await reviewer.review_changes(file_changes)
-            call_args = mock_run.call_args[0][0]
-            assert "large.py" not in call_args
-            assert "small.py" in call_args
-
-    @pytest.mark.asyncio
-    async def test_review_changes_includes_pr_context(self, sample_review_config):
-        """Test that PR title and description are included in prompt."""
-        reviewer = CodeReviewer(sample_review_config)
+_README_DIFF = "@@ -1,1 +1,2 @@\n # Title\n+Added line"
 
-        file_changes = {
-            "src/main.py": "@@ -1,1 +1,2 @@\n def main():\n+    pass"
-        }
+_MIXED_CHANGES = types.MappingProxyType({
+    "README.md": _README_DIFF,
+    "src/main.py": _SMALL_DIFF,
+})
 
-        with patch.object(reviewer.agent, 'run', new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = Mock(output=CodeReviewResponse(
-                summary="Looks good",
-                comments=[],
-                approved=True
-            ))
+_APPROVED_OUTPUT = CodeReviewResponse.model_construct(
+    summary="Looks good",
+    comments=[],
+    approved=True
+)
+
+
+class TestReviewChanges:
+    """Tests for review_changes method."""
 
+    def test_review_changes_scenarios(self, shared_reviewer, monkeypatch):
+        """Test the filtering, context and passthrough behavior in one loop."""
+        reviewer = shared_reviewer
+
+        async def _scenarios():
+            # Ignored files are filtered out of the prompt
+            stub = _RunStub(_APPROVED_OUTPUT)
+            monkeypatch.setattr(reviewer.agent, 'run', stub)
+            await reviewer.review_changes(_MIXED_CHANGES)
+            prompt = stub.calls[0]
+            assert "README.md" not in prompt
+            assert "src/main.py" in prompt
+
+            # Files over max_file_size are filtered out
+            stub = _RunStub(_APPROVED_OUTPUT)
+            monkeypatch.setattr(reviewer.agent, 'run', stub)
+            await reviewer.review_changes({
+                "large.py": _LARGE_DIFF,
+                "small.py": "@@ -1,1 +1,2 @@\n def small():\n+    pass"
+            })
+            prompt = stub.calls[0]
+            assert "large.py" not in prompt
+            assert "small.py" in prompt
+
+            # PR title and description are included in the prompt
+            stub = _RunStub(_APPROVED_OUTPUT)
+            monkeypatch.setattr(reviewer.agent, 'run', stub)
             await reviewer.review_changes(
-                file_changes,
+                {"src/main.py": _SMALL_DIFF},
                 pr_title="Add new feature",
                 pr_description="This PR adds a new feature to improve performance"
             )
+            prompt = stub.calls[0]
+            assert "PR Title: Add new feature" in prompt
+            assert "PR Description: This PR adds a new feature to improve performance" in prompt
 
-            call_args = mock_run.call_args[0][0]
-            assert "PR Title: Add new feature" in call_args
-            assert "PR Description: This PR adds a new feature to improve performance" in call_args
+            # The AI response is returned unchanged
+            expected_response = CodeReviewResponse(
+                summary="Code looks good",
+                comments=[],
+                approved=True
+            )
+            monkeypatch.setattr(reviewer.agent, 'run', _RunStub(expected_response))
+            result = await reviewer.review_changes(
+                {"src/main.py": _SMALL_DIFF}
+            )
+            assert result == expected_response
 
-    @pytest.mark.asyncio
-    async def test_review_changes_returns_response(self, sample_review_config):
-        """Test that review_changes returns the AI response."""
-        reviewer = CodeReviewer(sample_review_config)
+            # All files filtered out short-circuits without calling the agent
+            result = await reviewer.review_changes({
+                "README.md": _README_DIFF,
+                "config.json": "@@ -1,1 +1,2 @@\n {}\n+{\"key\": \"value\"}"
+            })
+            assert result.summary == "No files to review (all files filtered out)."
+            assert result.comments == []
+            assert result.approved is True
 
-        file_changes = {
-            "src/main.py": "@@ -1,1 +1,2 @@\n def main():\n+    pass"
-        }
+        asyncio.run(_scenarios())
 
-        expected_response = CodeReviewResponse(
-            summary="Code looks good",
-            comments=[],
-            approved=True
+    def test_review_changes_batches_large_prs(self, monkeypatch):
+        """Test that oversized change sets are split into concurrent batches."""
+        config = ReviewConfig(
+            model_provider="openai",
+            model_name="gpt-4",
+            github_token="test-token",
+            max_file_size=50000,
         )
+        reviewer = CodeReviewer(config)
 
-        with patch.object(reviewer.agent, 'run', new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = Mock(output=expected_response)
-
-            result = await reviewer.review_changes(file_changes)
-
-            assert result == expected_response
-
-    @pytest.mark.asyncio
-    async def test_review_changes_no_files_after_filtering(self, sample_review_config):
-        """Test behavior when all files are filtered out."""
-        reviewer = CodeReviewer(sample_review_config)
-
+        # Two diffs that together exceed the batch byte budget
+        big_diff = "@@ -1,1 +1,2 @@\n+" + ("x" * 40000)
         file_changes = {
-            "README.md": "@@ -1,1 +1,2 @@\n # Title\n+Added line",
-            "config.json": "@@ -1,1 +1,2 @@\n {}\n+{\"key\": \"value\"}"
+            "src/first.py": big_diff,
+            "src/second.py": big_diff,
         }
 
-        result = await reviewer.review_changes(file_changes)
+        stub = _RunStub(_APPROVED_OUTPUT)
+        monkeypatch.setattr(reviewer.agent, 'run', stub)
+        result = asyncio.run(reviewer.review_changes(file_changes))
 
-        assert result.summary == "No files to review (all files filtered out)."
-        assert result.comments == []
+        assert len(stub.calls) == 2
         assert result.approved is True
+        assert result.summary == "Looks good\n\nLooks good"